@@ -0,0 +1,80 @@
+"""
+Helpers shared by the img2bytes and img2rgb565 C header generators.
+"""
+import binascii
+import mmap
+import os
+import sys
+
+def list_image_files(directory_path, extensions):
+    """
+    Return the sorted names of the files in directory_path (non-recursive)
+    whose extension is one of extensions (case-insensitive).
+    """
+    # scandir entries carry their file type, so no extra stat() per name
+    with os.scandir(directory_path) as entries:
+        files = [e.name for e in entries
+                 if e.is_file() and e.name.lower().endswith(extensions)]
+    files.sort()  # Sort alphabetically
+    return files
+
+def read_png_bytes(file_path):
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read()
+    except IOError as e:
+        print(f"Error reading file {file_path}: {e}")
+        sys.exit(1)
+
+def map_png_bytes(file_path):
+    # Map the file read-only; pages are faulted in lazily as the hex writer walks it.
+    # The returned mmap supports len() and slicing like bytes; release with close_png_bytes().
+    # Each mapping holds a file descriptor, so only map a file that is written right away.
+    try:
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b''  # mmap cannot map an empty file
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except IOError as e:
+        print(f"Error reading file {file_path}: {e}")
+        sys.exit(1)
+
+def close_png_bytes(byte_data):
+    if isinstance(byte_data, mmap.mmap):
+        byte_data.close()
+
+def format_hex_lines(byte_data, elements_per_line=12):
+    """Yield bytes as ASCII '0xNN' array lines, hex-encoding each line in a single C call."""
+    for i in range(0, len(byte_data), elements_per_line):
+        # hexlify(..., b' ') yields b'AB CD ...'; expand each separator to b', 0x'
+        line = b'    0x' + binascii.hexlify(byte_data[i:i+elements_per_line], b' ').upper().replace(b' ', b', 0x')
+        if i + elements_per_line < len(byte_data):
+            line += b',\n'
+        else:
+            line += b'\n'
+        yield line
+
+def write_header_file(output_path, chunks):
+    # Stream encoded chunks to disk so the full header is never held in memory. They go
+    # to a temporary file next to the output, which only replaces output_path once every
+    # chunk has been written, so a failed input read never leaves a truncated header.
+    tmp_path = f"{output_path}.tmp"
+    try:
+        try:
+            with open(tmp_path, 'wb', buffering=1 << 20) as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            # Includes the SystemExit raised by read_png_bytes on a bad input
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        print(f"Header file successfully written to {output_path}")
+    except IOError as e:
+        print(f"Error writing to file {output_path}: {e}")
+        sys.exit(1)
+
+def sanitize_identifier(name):
+    # Replace invalid characters with underscores
+    return ''.join(c if c.isalnum() or c == '_' else '_' for c in name)
@@ -2,6 +2,21 @@
 import argparse
 import os
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from _img2bytes_core import (
+    close_png_bytes,
+    format_hex_lines,
+    list_image_files,
+    map_png_bytes,
+    read_png_bytes,
+    sanitize_identifier,
+    write_header_file,
+)
+
+# Number of files read ahead of the one being formatted in directory mode
+READ_AHEAD = 4
 
 def parse_arguments():
     # In the parse_arguments() function, update the description (if desired):
@@ -26,115 +41,88 @@ def parse_arguments():
     )
     return parser.parse_args()
 
-def read_png_bytes(file_path):
-    try:
-        with open(file_path, 'rb') as f:
-            return f.read()
-    except IOError as e:
-        print(f"Error reading file {file_path}: {e}")
-        sys.exit(1)
-
-def generate_header_content(array_name, byte_list, guard_name):
-    """Generate header content for a single PNG file."""
-    lines = []
-    lines.append(f'#ifndef {guard_name}\n')
-    lines.append(f'#define {guard_name}\n\n')
-    lines.append(f'const uint8_t {array_name}[] = {{\n')
+def generate_header_content(array_name, byte_data, guard_name):
+    """Generate header content for a single PNG file, one encoded chunk at a time."""
+    yield f'#ifndef {guard_name}\n'.encode()
+    yield f'#define {guard_name}\n\n'.encode()
+    yield f'const uint8_t {array_name}[] = {{\n'.encode()
     
     # Format the array elements, 12 per line for readability.
-    elements_per_line = 12
-    for i in range(0, len(byte_list), elements_per_line):
-        line_bytes = byte_list[i:i+elements_per_line]
-        line = '    ' + ', '.join(f'0x{byte:02X}' for byte in line_bytes)
-        if i + elements_per_line < len(byte_list):
-            line += ',\n'
-        else:
-            line += '\n'
-        lines.append(line)
+    yield from format_hex_lines(byte_data)
     
-    lines.append('};\n\n')
-    lines.append(f'const size_t {array_name}_SIZE = sizeof({array_name}) / sizeof({array_name}[0]);\n\n')
-    lines.append(f'#endif // {guard_name}\n')
-    return ''.join(lines)
-
-def write_header_file(output_path, content):
-    try:
-        with open(output_path, 'w') as f:
-            f.write(content)
-        print(f"Header file successfully written to {output_path}")
-    except IOError as e:
-        print(f"Error writing to file {output_path}: {e}")
-        sys.exit(1)
-
-def sanitize_identifier(name):
-    # Replace invalid characters with underscores
-    return ''.join(c if c.isalnum() or c == '_' else '_' for c in name)
+    yield b'};\n\n'
+    yield f'const size_t {array_name}_SIZE = sizeof({array_name}) / sizeof({array_name}[0]);\n\n'.encode()
+    yield f'#endif // {guard_name}\n'.encode()
 
 def process_file_mode(input_file, output_h, array_name, guard_name):
-    byte_data = read_png_bytes(input_file)
-    byte_list = list(byte_data)
-    header_content = generate_header_content(array_name, byte_list, guard_name)
-    write_header_file(output_h, header_content)
+    byte_data = map_png_bytes(input_file)
+    try:
+        write_header_file(output_h, generate_header_content(array_name, byte_data, guard_name))
+    finally:
+        close_png_bytes(byte_data)
 
 def process_directory_mode(directory_path, output_h, base_array_name, guard_name):
     # Find all .png files (case-insensitive) in the given directory (non-recursive)
-    files = [f for f in os.listdir(directory_path)
-         if os.path.isfile(os.path.join(directory_path, f)) and f.lower().endswith(('.png', '.jpg', '.jpeg'))]
-    files.sort()  # Sort alphabetically
+    files = list_image_files(directory_path, ('.png', '.jpg', '.jpeg'))
 
     if not files:
         print("No PNG files found in the directory.")
         sys.exit(1)
 
-    header_lines = []
-    header_lines.append(f'#ifndef {guard_name}\n')
-    header_lines.append(f'#define {guard_name}\n\n')
+    write_header_file(output_h, generate_directory_content(directory_path, files, base_array_name, guard_name))
+
+def read_files_ahead(paths):
+    """
+    Yield read_png_bytes() for each path, in order, while up to READ_AHEAD of the
+    following files are read concurrently. Only that window is held in memory.
+    """
+    with ThreadPoolExecutor(max_workers=READ_AHEAD) as executor:
+        pending = deque()
+        for path in paths:
+            pending.append(executor.submit(read_png_bytes, path))
+            if len(pending) > READ_AHEAD:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def generate_directory_content(directory_path, files, base_array_name, guard_name):
+    """Generate header content for a sorted list of files, one encoded chunk at a time."""
+    yield f'#ifndef {guard_name}\n'.encode()
+    yield f'#define {guard_name}\n\n'.encode()
 
     array_sizes = []
     array_names = []
 
     # Process each PNG file and output its byte array with a numeric suffix.
-    for idx, file in enumerate(files):
-        full_path = os.path.join(directory_path, file)
-        byte_data = read_png_bytes(full_path)
-        byte_list = list(byte_data)
+    paths = [os.path.join(directory_path, file) for file in files]
+    for idx, byte_data in enumerate(read_files_ahead(paths)):
         current_array_name = f"{base_array_name}_{idx:02d}"
         array_names.append(current_array_name)
-        array_sizes.append(len(byte_list))
+        array_sizes.append(len(byte_data))
         
-        header_lines.append(f'const uint8_t {current_array_name}[] = {{\n')
-        elements_per_line = 12
-        for i in range(0, len(byte_list), elements_per_line):
-            line_bytes = byte_list[i:i+elements_per_line]
-            line = '    ' + ', '.join(f'0x{b:02X}' for b in line_bytes)
-            if i + elements_per_line < len(byte_list):
-                line += ',\n'
-            else:
-                line += '\n'
-            header_lines.append(line)
-        header_lines.append('};\n\n')
+        yield f'const uint8_t {current_array_name}[] = {{\n'.encode()
+        yield from format_hex_lines(byte_data)
+        yield b'};\n\n'
 
     # Write an array of pointers to all byte arrays.
-    header_lines.append(f'const uint8_t* {base_array_name}_array[{len(array_names)}] = {{\n')
+    yield f'const uint8_t* {base_array_name}_array[{len(array_names)}] = {{\n'.encode()
     for idx, name in enumerate(array_names):
         if idx < len(array_names) - 1:
-            header_lines.append(f'    {name},\n')
+            yield f'    {name},\n'.encode()
         else:
-            header_lines.append(f'    {name}\n')
-    header_lines.append('};\n\n')
+            yield f'    {name}\n'.encode()
+    yield b'};\n\n'
 
     # Write an array of sizes (number of elements) for each byte array.
-    header_lines.append(f'const size_t {base_array_name}_sizes[{len(array_names)}] = {{\n')
+    yield f'const size_t {base_array_name}_sizes[{len(array_names)}] = {{\n'.encode()
     for idx, size in enumerate(array_sizes):
         if idx < len(array_sizes) - 1:
-            header_lines.append(f'    {size},\n')
+            yield f'    {size},\n'.encode()
         else:
-            header_lines.append(f'    {size}\n')
-    header_lines.append('};\n\n')
+            yield f'    {size}\n'.encode()
+    yield b'};\n\n'
 
-    header_lines.append(f'#endif // {guard_name}\n')
-    header_content = ''.join(header_lines)
-    write_header_file(output_h, header_content)
+    yield f'#endif // {guard_name}\n'.encode()
 
 def main():
     args = parse_arguments()
@@ -3,11 +3,47 @@ import sys
 import os
 from PIL import Image
 
-def convert_image_to_rgb565_data(input_image_path):
+from _img2bytes_core import list_image_files
+
+try:
+    import numpy as np
+except ImportError:  # fall back to the pure-Python lookup tables below
+    np = None
+
+# The Numba kernel is opt-in (IMG2RGB565_NUMBA=1): importing numba alone costs more
+# than it saves over the NumPy expression for a typical run.
+numba = None
+if np is not None and os.environ.get('IMG2RGB565_NUMBA') == '1':
+    try:
+        import numba
+    except ImportError:
+        print("IMG2RGB565_NUMBA is set but numba is not installed; using NumPy.")
+
+# Per-channel RGB565 lookup tables, used when NumPy is not available
+R5 = [(r & 0xF8) << 8 for r in range(256)]
+G6 = [(g & 0xFC) << 3 for g in range(256)]
+B5 = [b >> 3 for b in range(256)]
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _rgb_to_565(buf_u8, out_u16):
+        # JIT-compiled per-pixel conversion, writing straight into the preallocated output
+        for i in range(out_u16.size):
+            r = buf_u8[3 * i]
+            g = buf_u8[3 * i + 1]
+            b = buf_u8[3 * i + 2]
+            out_u16[i] = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+
+# ASCII b'0xXXXX' for every 16-bit value, built once so pixels are formatted by lookup
+_HEX16 = tuple(f'0x{v:04X}'.encode('ascii') for v in range(65536))
+
+# Template for one full line of 16 array elements
+LINE_TPL = b'    ' + b', '.join([b'%s'] * 16) + b',\n'
+
+def load_rgb_image(input_image_path):
     """
-    Open an image file, resize it to 480x480, convert to RGB mode,
-    and compute the RGB565 value for each pixel.
-    Returns a list of strings with each value formatted as '0xXXXX'.
+    Open an image file, resize it to 480x480 and convert to RGB mode.
+    Returns None if the file is missing or not a supported format.
     """
     if not os.path.isfile(input_image_path):
         print(f"File {input_image_path} does not exist.")
@@ -22,32 +58,55 @@ def convert_image_to_rgb565_data(input_image_path):
 
     # Load image, resize and convert to RGB
     img = Image.open(input_image_path).resize((480, 480))
-    img_rgb = img.convert('RGB')
+    return img.convert('RGB')
+
+def rgb565_data_from_image(img_rgb):
+    """
+    Compute the RGB565 value for each pixel of an RGB image (row-major order).
+    Returns a list of ASCII bytes with each value formatted as b'0xXXXX'.
+    """
+    if np is None:
+        # Split the raw RGB buffer into channel planes with C-level strided slices,
+        # then combine the precomputed channel tables
+        buf = img_rgb.tobytes()
+        return [_HEX16[R5[r] | G6[g] | B5[b]]
+                for r, g, b in zip(buf[0::3], buf[1::3], buf[2::3])]
+
+    if numba is not None:
+        rgb565 = np.empty(img_rgb.width * img_rgb.height, dtype=np.uint16)
+        _rgb_to_565(np.frombuffer(img_rgb.tobytes(), dtype=np.uint8), rgb565)
+    else:
+        # Compute 16-bit RGB565 values for the whole image at once (row-major order)
+        arr = np.asarray(img_rgb, dtype=np.uint16)
+        r, g, b = arr[..., 0], arr[..., 1], arr[..., 2]
+        rgb565 = (((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)).ravel()
+    return list(map(_HEX16.__getitem__, rgb565.tolist()))
 
-    data_rgb565 = []
-    for y in range(img_rgb.height):
-        for x in range(img_rgb.width):
-            r, g, b = img_rgb.getpixel((x, y))
-            # Compute 16-bit RGB565 value
-            rgb565 = ((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3)
-            data_rgb565.append(f'0x{rgb565:04X}')
-    return data_rgb565
+def convert_image_to_rgb565_data(input_image_path):
+    """
+    Open an image file, resize it to 480x480, convert to RGB mode,
+    and compute the RGB565 value for each pixel.
+    Returns a list of ASCII bytes with each value formatted as b'0xXXXX'.
+    """
+    img_rgb = load_rgb_image(input_image_path)
+    if img_rgb is None:
+        return None
+    return rgb565_data_from_image(img_rgb)
 
 def write_array_to_file(f, array_name, data):
     """
-    Write a C array declaration given the variable name and data list.
-    Formats the array with 16 items per line.
+    Write a C array declaration given the variable name and data list
+    to a file opened in binary mode. Formats the array with 16 items per line.
     """
     array_length = len(data)
-    f.write(f'const uint16_t {array_name}[{array_length}] = {{\n')
-    for i in range(0, array_length, 16):
-        # Create a line with at most 16 elements
-        line = ', '.join(data[i:i+16])
-        if i + 16 < array_length:
-            f.write(f'    {line},\n')
-        else:
-            f.write(f'    {line}\n')
-    f.write('};\n\n')
+    f.write(f'const uint16_t {array_name}[{array_length}] = {{\n'.encode())
+    # Every line but the last holds exactly 16 elements and ends with a comma
+    last = (array_length - 1) // 16 * 16 if array_length else 0
+    for i in range(0, last, 16):
+        f.write(LINE_TPL % tuple(data[i:i+16]))
+    if array_length:
+        f.write(b'    ' + b', '.join(data[last:]) + b'\n')
+    f.write(b'};\n\n')
 
 def process_file_mode(image_path):
     """
@@ -61,7 +120,7 @@ def process_file_mode(image_path):
     # Replace any dashes or spaces in the variable name
     array_name = filename_no_ext.replace('-', '_').replace(' ', '_')
     output_filename = f"rgb565_{filename_no_ext}.h"
-    with open(output_filename, 'w') as f:
+    with open(output_filename, 'wb', buffering=1 << 20) as f:
         write_array_to_file(f, array_name, data)
     print(f"File converted and saved as {output_filename}")
 
@@ -71,10 +130,8 @@ def process_directory_mode(directory_path):
     in alphabetical order and write each converted image as a separate C array.
     Also, write out an array of pointers and an array of array sizes.
     """
-    # Find all .jpg and .jpeg files (case-insensitive) in the directory
-    files = [f for f in os.listdir(directory_path)
-             if os.path.isfile(os.path.join(directory_path, f)) and f.lower().endswith(('.jpg', '.jpeg'))]
-    files.sort()  # Sort files alphabetically
+    # Find all .jpg and .jpeg files (case-insensitive) in the directory, sorted
+    files = list_image_files(directory_path, ('.jpg', '.jpeg'))
 
     if not files:
         print("No JPG files found in the directory.")
@@ -88,7 +145,7 @@ def process_directory_mode(directory_path):
     array_sizes = []
     num_images = 0
 
-    with open(output_filename, 'w') as f:
+    with open(output_filename, 'wb', buffering=1 << 20) as f:
         # Process each file and output its array definition.
         for idx, file in enumerate(files):
             full_path = os.path.join(directory_path, file)
@@ -101,20 +158,20 @@ def process_directory_mode(directory_path):
             num_images += 1
 
         # Write an array of pointers to all image arrays.
-        f.write(f'const uint16_t* {base_name}_array[{num_images}] = {{\n')
+        f.write(f'const uint16_t* {base_name}_array[{num_images}] = {{\n'.encode())
         pointer_lines = []
         for idx in range(num_images):
             pointer_lines.append(f'    {base_name}_{idx:02d}')
-        f.write(',\n'.join(pointer_lines))
-        f.write('\n};\n\n')
+        f.write(',\n'.join(pointer_lines).encode())
+        f.write(b'\n};\n\n')
 
         # Write an array of sizes (number of elements) for each image array.
-        f.write(f'const size_t {base_name}_sizes[{num_images}] = {{\n')
+        f.write(f'const size_t {base_name}_sizes[{num_images}] = {{\n'.encode())
         size_lines = []
         for size in array_sizes:
             size_lines.append(f'    {size}')
-        f.write(',\n'.join(size_lines))
-        f.write('\n};\n')
+        f.write(',\n'.join(size_lines).encode())
+        f.write(b'\n};\n')
     print(f"Processed {num_images} images. Output saved to {output_filename}")
 
 if __name__ == "__main__":
@@ -2,26 +2,60 @@
 import os
 import sys
 import argparse
+from multiprocessing import Pool
+import numpy as np
 from PIL import Image
 import imageio
 
-def crop_center_square(img: Image.Image) -> Image.Image:
+try:
+    import cv2
+except ImportError:  # fall back to PIL's resampler
+    cv2 = None
+
+try:
+    import av
+except ImportError:  # fall back to imageio's ffmpeg subprocess reader
+    av = None
+
+# Animated image formats, always decoded through imageio rather than PyAV
+IMAGE_SEQUENCE_EXTS = (".gif", ".webp", ".apng", ".png", ".tif", ".tiff")
+
+def center_square_box(w: int, h: int) -> tuple:
     """
-    Crop the largest possible square from the center of the image.
+    Return the (left, top, right, bottom) box of the largest centered square.
     """
-    w, h = img.size
     side = min(w, h)
     left = (w - side) // 2
     top = (h - side) // 2
-    return img.crop((left, top, left + side, top + side))
+    return (left, top, left + side, top + side)
+
+def crop_center_square(img: Image.Image) -> Image.Image:
+    """
+    Crop the largest possible square from the center of the image.
+    """
+    return img.crop(center_square_box(*img.size))
+
+def resize_center_square(img: Image.Image, size: int) -> Image.Image:
+    """
+    Crop the center square and resize it to size×size.
+    Downsampling uses OpenCV's SIMD INTER_AREA resampler when it is installed; everything
+    else uses PIL's LANCZOS, which samples straight from the box without a separate crop.
+    """
+    left, top, right, bottom = center_square_box(*img.size)
+    # np.asarray copies the full-resolution image out of PIL, which only pays off when
+    # cv2 is shrinking it; for upscaling or same-size output PIL alone is faster.
+    if cv2 is not None and img.mode in ("RGB", "L") and size < right - left:
+        crop = np.asarray(img)[top:bottom, left:right]
+        return Image.fromarray(cv2.resize(crop, (size, size), interpolation=cv2.INTER_AREA))
+    # resize() samples straight from the box region of the source image
+    return img.resize((size, size), Image.LANCZOS, box=(left, top, right, bottom))
 
 def process_image(input_path: str, size: int = 480):
     """
     Crop center square and resize to specified size×size, then save as JPEG with size suffix in same folder.
     """
     img = Image.open(input_path)
-    img = crop_center_square(img)
-    img = img.resize((size, size), Image.LANCZOS)
+    img = resize_center_square(img, size)
 
     dirpath = os.path.dirname(input_path)
     base = os.path.splitext(os.path.basename(input_path))[0]
@@ -31,6 +65,43 @@ def process_image(input_path: str, size: int = 480):
     img.save(out_path, "JPEG", quality=80)
     print(f"[+] Saved cropped & resized image to {out_path}")
 
+def iter_frames(input_path: str):
+    """
+    Yield the frames of a GIF/video as RGB ndarrays.
+    Video containers are decoded in-process with PyAV (threaded, hardware decoders where
+    available) when it is installed; animated image formats, and anything libav cannot
+    read, go through imageio.
+    """
+    # libav can silently drop frames of some GIFs and gains nothing on image formats
+    is_image_sequence = os.path.splitext(input_path)[1].lower() in IMAGE_SEQUENCE_EXTS
+    if av is not None and not is_image_sequence:
+        yielded = False
+        try:
+            with av.open(input_path) as container:
+                if container.streams.video:
+                    stream = container.streams.video[0]
+                    stream.thread_type = "AUTO"
+                    for frame in container.decode(stream):
+                        yielded = True
+                        yield frame.to_ndarray(format="rgb24")
+                    return
+        except av.error.FFmpegError:
+            # Only fall back while no frame has gone out, or frames would be duplicated
+            if yielded:
+                raise
+    yield from imageio.get_reader(input_path)
+
+def _process_frame(args):
+    """
+    Worker for process_sequence: crop, resize and save a single decoded frame.
+    """
+    idx, frame, size, output_folder = args
+    img = resize_center_square(Image.fromarray(frame), size)
+    out_path = os.path.join(output_folder, f"{idx}.jpg")
+    # Single-pass baseline 4:2:0 encode; installing Pillow-SIMD with libjpeg-turbo
+    # speeds this up further without any code changes.
+    img.save(out_path, "JPEG", quality=30, optimize=False, progressive=False, subsampling=2)
+
 def process_sequence(input_path: str, size: int = 240):
     """
     Extract frames from GIF/video, crop center square, resize to specified size×size, compress, and save in a new folder named after the file.
@@ -39,16 +110,15 @@ def process_sequence(input_path: str, size: int = 240):
     output_folder = os.path.join(os.getcwd(), base)
     os.makedirs(output_folder, exist_ok=True)
 
-    reader = imageio.get_reader(input_path)
-    for idx, frame in enumerate(reader):
-        img = Image.fromarray(frame)
-        img = crop_center_square(img)
-        img = img.resize((size, size), Image.LANCZOS)
-        out_path = os.path.join(output_folder, f"{idx}.jpg")
-        img.save(out_path, "JPEG", quality=30)
-        if (idx + 1) % 50 == 0:
-            print(f"  ↳ Processed {idx+1} frames…")
-    print(f"[+] Done: {idx+1} frames saved in {output_folder}/")
+    tasks = ((idx, frame, size, output_folder) for idx, frame in enumerate(iter_frames(input_path)))
+    count = 0
+    # The main process only decodes; crop/resize/encode runs on the other cores.
+    with Pool() as pool:
+        for _ in pool.imap_unordered(_process_frame, tasks, chunksize=16):
+            count += 1
+            if count % 50 == 0:
+                print(f"  ↳ Processed {count} frames…")
+    print(f"[+] Done: {count} frames saved in {output_folder}/")
 
 def main():
     parser = argparse.ArgumentParser(